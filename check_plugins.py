@@ -4,38 +4,57 @@
 """
 
 import sys
+from pathlib import Path
 
-sys.path.append(".")
+# 以脚本所在目录为项目根目录，不依赖当前工作目录
+sys.path.append(str(Path(__file__).resolve().parent))
 
 from xiaomusic.config import Config
 from xiaomusic.js_plugin_manager import JSPluginManager
 
 
+class SimpleLogger:
+    def info(self, msg):
+        print(f"[INFO] {msg}")
+
+    def warning(self, msg):
+        print(f"[WARNING] {msg}")
+
+    def error(self, msg, **kwargs):
+        print(f"[ERROR] {msg}")
+
+    def debug(self, msg):
+        print(f"[DEBUG] {msg}")
+
+    def isEnabledFor(self, level):
+        return True
+
+
+class _MockConfig:
+    """插件管理器只需要配置目录"""
+
+    __slots__ = ("conf_path",)
+
+
+class _MockXiaomusic:
+    """代替 XiaoMusic 实例传给插件管理器"""
+
+    __slots__ = ("config",)
+
+
 def check_all_plugins():
     print("=== 检查所有插件加载状态 ===\n")
 
     config = Config()
     config.verbose = True
 
-    class SimpleLogger:
-        def info(self, msg):
-            print(f"[INFO] {msg}")
-
-        def error(self, msg):
-            print(f"[ERROR] {msg}")
-
-        def debug(self, msg):
-            print(f"[DEBUG] {msg}")
-
     print("1. 创建插件管理器...")
-    manager = JSPluginManager(None)
-    manager.config = config
+    mock = _MockXiaomusic()
+    mock.config = _MockConfig()
+    mock.config.conf_path = config.conf_path
+    manager = JSPluginManager(mock)
     manager.log = SimpleLogger()
 
-    import time
-
-    time.sleep(3)  # 等待插件加载
-
     print("\n2. 获取所有插件状态...")
     plugins = manager.refresh_plugin_list()
     print(f"   总共找到 {len(plugins)} 个插件")
@@ -59,8 +78,7 @@ def check_all_plugins():
         print(f"     ✗ {plugin['name']}: {plugin.get('error', 'Unknown error')}")
 
     # 清理
-    if hasattr(manager, "node_process") and manager.node_process:
-        manager.node_process.terminate()
+    manager.shutdown()
 
 
 if __name__ == "__main__":
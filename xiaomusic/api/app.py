@@ -14,6 +14,7 @@ from xiaomusic.api.dependencies import (
     AuthStaticFiles,
     reset_http_server,
 )
+from xiaomusic.utils.network_utils import close_shared_session
 
 if TYPE_CHECKING:
     from xiaomusic.xiaomusic import XiaoMusic
@@ -45,6 +46,8 @@ async def app_lifespan(app):
             except Exception as e:
                 if _state.is_initialized():
                     _state._log.error(f"Background task cleanup error: {e}")
+        # 关闭在线搜索等共用的 HTTP 会话
+        await close_shared_session()
 
 
 # 创建 FastAPI 应用实例
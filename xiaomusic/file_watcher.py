@@ -1,13 +1,16 @@
 """文件监控模块
 
-提供音乐目录的文件变化监控功能，支持防抖延迟处理。
+提供音乐目录的文件变化监控功能，支持防抖延迟处理；
+以及 JS 插件目录和插件配置文件的变化监控。
 """
 
 import os
 
 from watchdog.events import (
+    FileClosedEvent,
     FileCreatedEvent,
     FileDeletedEvent,
+    FileModifiedEvent,
     FileMovedEvent,
     FileSystemEventHandler,
 )
@@ -84,6 +87,73 @@ class XiaoMusicPathWatch(FileSystemEventHandler):
         )
 
 
+class PluginPathWatch(FileSystemEventHandler):
+    """JS 插件目录及插件配置文件监控类
+
+    插件目录中 .js 文件的增删、移动触发 on_plugins_change，
+    插件配置文件的修改触发 on_config_change。回调在监控线程中执行。
+
+    Attributes:
+        plugins_dir: 插件目录
+        config_path: 插件配置文件路径
+        on_plugins_change: 插件文件变化时的回调函数
+        on_config_change: 配置文件变化时的回调函数
+    """
+
+    def __init__(self, plugins_dir, config_path, on_plugins_change, on_config_change):
+        """初始化插件监控器
+
+        Args:
+            plugins_dir: 插件目录
+            config_path: 插件配置文件路径
+            on_plugins_change: 插件文件变化时的回调函数
+            on_config_change: 配置文件变化时的回调函数
+        """
+        self.plugins_dir = os.path.abspath(plugins_dir)
+        self.config_path = os.path.abspath(config_path)
+        self.on_plugins_change = on_plugins_change
+        self.on_config_change = on_config_change
+
+    def on_any_event(self, event):
+        """处理文件系统事件
+
+        Args:
+            event: 文件系统事件对象
+        """
+        if event.is_directory:
+            return  # 忽略目录事件
+
+        paths = [event.src_path]
+        # 处理移动事件的目标路径
+        if getattr(event, "dest_path", ""):
+            paths.append(event.dest_path)
+
+        for path in map(os.path.abspath, paths):
+            if path == self.config_path:
+                # 只处理写入类事件；Linux 上普通读取也会产生 opened/closed_no_write 事件，
+                # 若同样触发回调，每次读取配置都会清空配置缓存
+                if isinstance(
+                    event,
+                    FileModifiedEvent
+                    | FileClosedEvent
+                    | FileCreatedEvent
+                    | FileDeletedEvent
+                    | FileMovedEvent,
+                ):
+                    self.on_config_change()
+                return
+            if (
+                path.endswith(".js")
+                and os.path.dirname(path) == self.plugins_dir
+                and isinstance(
+                    event, FileCreatedEvent | FileDeletedEvent | FileMovedEvent
+                )
+            ):
+                # 只关心插件文件的增删，插件内容修改不影响插件索引
+                self.on_plugins_change()
+                return
+
+
 class FileWatcherManager:
     """文件监控管理器
 
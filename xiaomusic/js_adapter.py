@@ -4,12 +4,53 @@ JS 插件适配器
 将 MusicFree JS 插件的数据格式转换为 xiaomusic 接口规范
 """
 
+import functools
 import logging
+import re
+
+# 插件返回的时长可能是 "mm:ss" 或 "hh:mm:ss" 字符串
+_INTERVAL_RE = re.compile(r"^(?:(\d+):)?(\d+):(\d+)$")
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_interval(text: str) -> int:
+    """解析字符串形式的时长（结果缓存，常见时长只解析一次）"""
+    m = _INTERVAL_RE.match(text.strip())
+    if m:
+        return int(m[1] or 0) * 3600 + int(m[2]) * 60 + int(m[3])
+    try:
+        return int(float(text))
+    except ValueError:
+        return 0
+
+
+# xiaomusic 音乐项字段 -> 插件音乐项字段
+_XM_TO_PLUGIN = (
+    ("id", "id"),
+    ("title", "title"),
+    ("artist", "artist"),
+    ("album", "album"),
+    ("url", "url"),
+    ("cover", "artwork"),
+    ("lyric", "lyric"),
+    ("quality", "quality"),
+)
+
+
+def _parse_duration(value) -> int:
+    """将插件返回的时长统一转换为秒数"""
+    if isinstance(value, int | float):
+        return int(value)
+    if not value:
+        return 0
+    return _parse_interval(str(value))
 
 
 class JSAdapter:
     """JS 插件数据适配器"""
 
+    __slots__ = ("xiaomusic", "log")
+
     def __init__(self, xiaomusic):
         self.xiaomusic = xiaomusic
         self.log = logging.getLogger(__name__)
@@ -18,35 +59,34 @@ class JSAdapter:
         self, plugin_results: list[dict], plugin_name: str
     ) -> list[str]:
         """格式化搜索结果为 xiaomusic 格式，返回 ID 列表"""
+        all_music = self.xiaomusic._music_library.all_music
         formatted_ids = []
         for item in plugin_results:
             if not isinstance(item, dict):
                 self.log.warning(f"Invalid item format in plugin {plugin_name}: {item}")
                 continue
 
+            get = item.get
             # 构造符合 xiaomusic 格式的音乐项
             music_id = self._generate_music_id(
-                plugin_name, item.get("id", ""), item.get("songmid", "")
+                plugin_name, get("id", ""), get("songmid", "")
             )
-            music_item = {
+            # 添加到 all_music 字典中（original_data 只是引用，不复制原始数据；
+            # convert_music_item_for_plugin 需要用它把插件自己的 id、songmid 等字段原样回传）
+            all_music[music_id] = {
                 "id": music_id,
-                "title": item.get("title", item.get("name", "")),
+                "title": get("title") or get("name", ""),
                 "artist": self._extract_artists(item),
-                "album": item.get("album", item.get("albumName", "")),
+                "album": get("album") or get("albumName", ""),
                 "source": "online",
                 "plugin_name": plugin_name,
                 "original_data": item,
-                "duration": item.get("duration", 0),
-                "cover": item.get(
-                    "artwork", item.get("cover", item.get("albumPic", ""))
-                ),
-                "url": item.get("url", ""),
-                "lyric": item.get("lyric", item.get("lrc", "")),
-                "quality": item.get("quality", ""),
+                "duration": _parse_duration(get("duration") or get("interval")),
+                "cover": get("artwork") or get("cover") or get("albumPic", ""),
+                "url": get("url", ""),
+                "lyric": get("lyric") or get("lrc", ""),
+                "quality": get("quality", ""),
             }
-
-            # 添加到 all_music 字典中
-            self.xiaomusic._music_library.all_music[music_id] = music_item
             formatted_ids.append(music_id)
 
         return formatted_ids
@@ -213,17 +253,8 @@ class JSAdapter:
         if isinstance(music_item, dict) and "original_data" in music_item:
             return music_item["original_data"]
 
-        # 否则构造一个基本的音乐项
-        converted = {
-            "id": music_item.get("id", ""),
-            "title": music_item.get("title", ""),
-            "artist": music_item.get("artist", ""),
-            "album": music_item.get("album", ""),
-            "url": music_item.get("url", ""),
-            "duration": music_item.get("duration", 0),
-            "artwork": music_item.get("cover", ""),
-            "lyric": music_item.get("lyric", ""),
-            "quality": music_item.get("quality", ""),
-        }
-
+        # 否则按字段映射表构造一个基本的音乐项
+        get = music_item.get
+        converted = {dst: get(src, "") for src, dst in _XM_TO_PLUGIN}
+        converted["duration"] = get("duration", 0)
         return converted
@@ -4,6 +4,9 @@ JS 插件管理器
 负责加载、管理和运行 MusicFree JS 插件
 """
 
+import copy
+import functools
+import itertools
 import json
 import logging
 import os
@@ -11,8 +14,62 @@ import shutil
 import subprocess
 import threading
 import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
 from typing import Any
 
+try:
+    import orjson
+except ImportError:  # orjson 为可选依赖，未安装时回退到标准库 json
+    orjson = None
+
+
+def _dumps(obj: Any) -> bytes:
+    """序列化为 UTF-8 JSON 字节串（用于与 Node.js 进程通信）"""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _loads(data: bytes | str) -> Any:
+    """解析 JSON，orjson 的 JSONDecodeError 是 json.JSONDecodeError 的子类"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+# 模块目录及随模块分发的文件路径，只在导入时计算一次
+_MODULE_DIR = os.path.dirname(os.path.abspath(__file__))
+_RUNNER_PATH = os.path.join(_MODULE_DIR, "js_plugin_runner.js")
+_EXAMPLE_CONFIG_PATH = os.path.join(_MODULE_DIR, "plugins-config-example.json")
+
+# 与 Node.js 进程通信的管道缓冲区大小（Linux 默认管道容量只有 64KB）
+_PIPE_BUFFER_SIZE = 256 * 1024
+
+# 并发下载插件的最大线程数
+_DOWNLOAD_WORKERS = 8
+
+# 已解析的插件配置：(配置文件路径, mtime) -> 配置数据，文件修改后自动失效
+_CONFIG_CACHE: dict[tuple[str, int], dict[str, Any]] = {}
+
+
+def _enlarge_pipe(pipe) -> None:
+    """在 Linux 上扩大管道容量，大批量搜索结果无需分多次读写"""
+    try:
+        import fcntl
+
+        fcntl.fcntl(pipe.fileno(), fcntl.F_SETPIPE_SZ, _PIPE_BUFFER_SIZE)
+    except (ImportError, AttributeError, OSError):
+        # 非 Linux 平台或超出系统限制时保持默认容量
+        pass
+
+
+@functools.lru_cache(maxsize=1)
+def _get_node_path() -> str:
+    """查找 node 可执行文件路径，进程生命周期内只查找一次"""
+    return shutil.which("node") or "node"
+
 
 class JSPluginManager:
     """JS 插件管理器"""
@@ -22,154 +79,219 @@ class JSPluginManager:
         base_path = self.xiaomusic.config.conf_path
         self.log = logging.getLogger(__name__)
         # JS插件文件夹：
-        self.plugins_dir = os.path.join(base_path, "js_plugins")
+        self.plugins_dir = os.path.abspath(os.path.join(base_path, "js_plugins"))
         # 插件配置Json：
-        self.plugins_config_path = os.path.join(base_path, "plugins-config.json")
+        self.plugins_config_path = os.path.abspath(
+            os.path.join(base_path, "plugins-config.json")
+        )
+        # 插件文件路径前缀，拼接插件路径时只需一次字符串格式化
+        self._plugin_path_prefix = self.plugins_dir + os.sep
         self.plugins = {}  # 插件状态信息
+        # 插件索引：插件名 -> 插件文件路径，由 refresh_plugin_index() 维护
+        self._plugin_paths: dict[str, str] = {}
+        self._load_locks: dict[str, threading.Lock] = {}  # 插件名 -> 加载锁
+        self._config_lock = threading.Lock()  # 串行化插件配置文件的读取-修改-写回
         self.node_process = None
-        self.message_queue = []
-        self.response_handlers = {}
-        self._lock = threading.Lock()
-        self.request_id = 0
-        self.pending_requests = {}
+        self._lock = threading.Lock()  # 只保护写管道，不覆盖等待响应的过程
+        self._request_ids = itertools.count(1)  # 单调递增的请求 ID
+        self.pending_requests: dict[int, Future] = {}  # 请求 ID -> 等待中的响应
+        # 只读请求（搜索、歌词、专辑、歌手作品）的结果缓存，LRU + TTL
+        self._rpc_cache: OrderedDict[str, tuple[float, dict[str, Any]]] = OrderedDict()
+        self._rpc_cache_lock = threading.Lock()
+        self._rpc_cache_size = 512
+        self._rpc_cache_ttl = 5 * 60  # 缓存有效期5分钟
         self._is_shutting_down = False  # 添加关闭标志
+        self._stdout_thread: threading.Thread | None = None  # 当前进程的读取线程
+        self._observer = None  # 插件目录及配置文件监控器，见 start_watch()
+        # 监控运行期间直接使用的配置数据，配置文件变化时由监控置空
+        self._watched_config: dict[str, Any] | None = None
+        self._config_generation = 0  # 每次使配置缓存失效时加一
 
-        # 启动 Node.js 子进程
+        # 启动 Node.js 子进程（常驻，所有插件共用同一个运行器）
         self._start_node_process()
 
-        # 启动消息处理线程
-        self._start_message_handler()
+        # 启动进程监控线程（只启动一次，进程重启时复用）
+        threading.Thread(target=self._monitor_node_process, daemon=True).start()
 
         # 加载插件
         self._load_plugins()
 
-        # ... 配置文件相关 ...
-        self._config_cache = None
-        self._config_cache_time = 0
-        self._config_cache_ttl = 3 * 60  # 缓存有效期5秒，可根据需要调整
-
     def _start_node_process(self):
         """启动 Node.js 子进程"""
-        runner_path = os.path.join(os.path.dirname(__file__), "js_plugin_runner.js")
-
         try:
             self.node_process = subprocess.Popen(
-                ["node", "--max-old-space-size=128", runner_path],
+                [_get_node_path(), "--max-old-space-size=128", _RUNNER_PATH],
                 stdin=subprocess.PIPE,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.PIPE,
-                text=True,
-                encoding="utf-8",
-                errors="replace",
-                bufsize=1,  # 行缓冲
+                # 使用字节流，收发直接走 UTF-8 JSON，省去文本层的编解码
+                bufsize=_PIPE_BUFFER_SIZE,
             )
+            _enlarge_pipe(self.node_process.stdin)
+            _enlarge_pipe(self.node_process.stdout)
 
             self.log.info("Node.js process started successfully")
 
-            # 启动进程监控线程
-            threading.Thread(target=self._monitor_node_process, daemon=True).start()
+            # 启动消息处理线程，与当前进程绑定，进程退出后线程自然结束
+            self._stdout_thread = self._start_message_handler(self.node_process)
 
         except Exception as e:
             self.log.error(f"Failed to start Node.js process: {e}")
             raise
 
     def _monitor_node_process(self):
-        """监控 Node.js 进程状态"""
-        while True:
+        """监控 Node.js 进程状态
+
+        阻塞等待进程退出，退出后立即重启，不再定时轮询进程状态。
+        """
+        while not self._is_shutting_down:
+            self.node_process.wait()
             if self._is_shutting_down:
                 break
-            if self.node_process and self.node_process.poll() is not None:
-                if not self._is_shutting_down:
-                    self.log.warning("Node.js process died, restarting...")
-                    self._start_node_process()
-            time.sleep(5)
+            self.log.warning("Node.js process died, restarting...")
+            # 等读取线程处理完进程退出前已输出的响应，剩余请求不会再有响应，立即失败
+            self._stdout_thread.join(timeout=5)
+            self._fail_pending_requests(
+                ConnectionError("Node.js process exited before responding")
+            )
+            try:
+                self._start_node_process()
+            except Exception:
+                # 启动失败时稍后重试，避免忙等
+                time.sleep(5)
+                continue
+            # 新进程中没有任何插件，需要重新加载
+            self.reload_plugins()
 
-    def _start_message_handler(self):
-        """启动消息处理线程"""
+    def _start_message_handler(self, process) -> threading.Thread:
+        """启动消息处理线程，返回 stdout 读取线程"""
 
         def stdout_handler():
-            while True:
-                if self.node_process and self.node_process.stdout:
-                    try:
-                        line = self.node_process.stdout.readline()
-                        if line:
-                            response = json.loads(line.strip())
-                            self._handle_response(response)
-                    except json.JSONDecodeError as e:
-                        # 捕获非 JSON 输出（可能是插件的调试信息或错误信息）
-                        self.log.warning(
-                            f"Non-JSON output from Node.js process: {line.strip()}, error: {e}"
-                        )
-                    except Exception as e:
-                        self.log.error(f"Message handler error: {e}")
-                time.sleep(0.1)
+            # 阻塞读取直到 EOF，不再每行额外 sleep
+            for line in process.stdout:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    response = _loads(line)
+                    self._handle_response(response)
+                except json.JSONDecodeError as e:
+                    # stdout 只用于协议通信，无法解析的行说明协议出错，不做重试
+                    self.log.error(
+                        f"Malformed frame from Node.js process: {line[:200]!r}, error: {e}"
+                    )
+                except Exception as e:
+                    self.log.error(f"Message handler error: {e}")
 
         def stderr_handler():
             """处理 Node.js 进程的错误输出"""
-            while True:
-                if self.node_process and self.node_process.stderr:
-                    try:
-                        error_line = self.node_process.stderr.readline()
-                        if error_line:
-                            self.log.error(
-                                f"Node.js process error output: {error_line.strip()}"
-                            )
-                    except Exception as e:
-                        self.log.error(f"Error handler error: {e}")
-                time.sleep(0.1)
-
-        threading.Thread(target=stdout_handler, daemon=True).start()
+            for error_line in process.stderr:
+                error_line = error_line.decode("utf-8", "replace").strip()
+                if error_line:
+                    self.log.error(f"Node.js process error output: {error_line}")
+
+        stdout_thread = threading.Thread(target=stdout_handler, daemon=True)
+        stdout_thread.start()
         threading.Thread(target=stderr_handler, daemon=True).start()
+        return stdout_thread
 
     def _send_message(
         self, message: dict[str, Any], timeout: int = 30
     ) -> dict[str, Any]:
-        """发送消息到 Node.js 子进程"""
+        """发送消息到 Node.js 子进程
+
+        每个请求分配唯一 ID 并登记一个 Future，由 stdout 读取线程按 ID 分发响应，
+        因此多个请求可以同时在同一条管道上等待，互不阻塞。
+        """
+        future: Future = Future()
         with self._lock:
             if not self.node_process or self.node_process.poll() is not None:
                 raise Exception("Node.js process not available")
 
-            message_id = f"msg_{int(time.time() * 1000)}"
+            message_id = next(self._request_ids)
             message["id"] = message_id
 
-            # 记录发送的消息
-            self.log.info(
-                f"JS Plugin Manager sending message: {message.get('action', 'unknown')} for plugin: {message.get('pluginName', 'unknown')}"
-            )
-            if "params" in message:
-                self.log.info(f"JS Plugin Manager search params: {message['params']}")
-            elif "musicItem" in message:
-                self.log.info(f"JS Plugin Manager music item: {message['musicItem']}")
-
-            # 发送消息
-            self.node_process.stdin.write(json.dumps(message) + "\n")
-            self.node_process.stdin.flush()
-
-            # 等待响应
-            response = self._wait_for_response(message_id, timeout)
-            self.log.info(
+            # 记录发送的消息（未开启 DEBUG 时跳过，避免在持锁期间格式化大对象）
+            if self.log.isEnabledFor(logging.DEBUG):
+                self.log.debug(
+                    f"JS Plugin Manager sending message: {message.get('action', 'unknown')} for plugin: {message.get('pluginName', 'unknown')}"
+                )
+                if "params" in message:
+                    self.log.debug(
+                        f"JS Plugin Manager search params: {message['params']}"
+                    )
+                elif "musicItem" in message:
+                    self.log.debug(
+                        f"JS Plugin Manager music item: {message['musicItem']}"
+                    )
+
+            # 先登记再发送，避免响应先于登记到达
+            self.pending_requests[message_id] = future
+            try:
+                self.node_process.stdin.write(_dumps(message) + b"\n")
+                self.node_process.stdin.flush()
+            except Exception:
+                self.pending_requests.pop(message_id, None)
+                raise
+
+        # 等待响应（不持有锁）
+        response = self._wait_for_response(message_id, future, timeout)
+        if self.log.isEnabledFor(logging.DEBUG):
+            self.log.debug(
                 f"JS Plugin Manager received response for message {message_id}: {response.get('success', 'unknown')}"
             )
-            return response
+        return response
 
-    def _wait_for_response(self, message_id: str, timeout: int) -> dict[str, Any]:
+    def _wait_for_response(
+        self, message_id: int, future: Future, timeout: int
+    ) -> dict[str, Any]:
         """等待特定消息的响应"""
-        start_time = time.time()
+        try:
+            return future.result(timeout=timeout)
+        except FutureTimeoutError:
+            # 超时后移除登记，迟到的响应直接丢弃
+            self.pending_requests.pop(message_id, None)
+            raise TimeoutError(f"Message {message_id} timeout") from None
 
-        while time.time() - start_time < timeout:
-            if message_id in self.response_handlers:
-                response = self.response_handlers.pop(message_id)
-                return response
-            time.sleep(0.1)
+    def _send_cached_message(
+        self, message: dict[str, Any], timeout: int = 30
+    ) -> dict[str, Any]:
+        """发送只读请求，成功的响应按 LRU + TTL 缓存
 
-        raise TimeoutError(f"Message {message_id} timeout")
+        热门歌曲的重复搜索、当前歌曲的歌词等请求直接命中缓存，
+        不再经过 Node.js 进程和上游接口。
+        """
+        key = json.dumps(message, sort_keys=True, ensure_ascii=False)
+        now = time.monotonic()
+        with self._rpc_cache_lock:
+            cached = self._rpc_cache.get(key)
+            if cached is not None:
+                if now - cached[0] < self._rpc_cache_ttl:
+                    self._rpc_cache.move_to_end(key)
+                    # 返回副本，调用方会原地修改结果（排序、截断等）
+                    return copy.deepcopy(cached[1])
+                del self._rpc_cache[key]
+
+        response = self._send_message(message, timeout)
+        if response.get("success"):
+            with self._rpc_cache_lock:
+                self._rpc_cache[key] = (now, copy.deepcopy(response))
+                self._rpc_cache.move_to_end(key)
+                while len(self._rpc_cache) > self._rpc_cache_size:
+                    self._rpc_cache.popitem(last=False)
+        return response
+
+    def _invalidate_rpc_cache(self):
+        """清空插件请求结果缓存"""
+        with self._rpc_cache_lock:
+            self._rpc_cache.clear()
 
     def _handle_response(self, response: dict[str, Any]):
         """处理 Node.js 进程的响应"""
         message_id = response.get("id")
-        self.log.debug(
-            f"JS Plugin Manager received raw response: {response}"
-        )  # 添加原始响应日志
+        if self.log.isEnabledFor(logging.DEBUG):
+            # 添加原始响应日志
+            self.log.debug(f"JS Plugin Manager received raw response: {response}")
 
         # 添加更严格的数据验证
         if not isinstance(response, dict):
@@ -202,8 +324,20 @@ class JSPluginManager:
                     )
                     result["data"] = []
 
-        if message_id:
-            self.response_handlers[message_id] = response
+        future = self.pending_requests.pop(message_id, None)
+        if future is None:
+            self.log.debug(
+                f"JS Plugin Manager dropped unmatched response: {message_id}"
+            )
+            return
+        future.set_result(response)
+
+    def _fail_pending_requests(self, exc: Exception):
+        """让所有等待中的请求立即以异常结束，不必等到超时"""
+        pending, self.pending_requests = self.pending_requests, {}
+        for future in pending.values():
+            if not future.done():
+                future.set_exception(exc)
 
     """------------------------------开放接口相关函数----------------------------------------"""
 
@@ -244,8 +378,8 @@ class JSPluginManager:
         """切换开放接口配置状态"""
         try:
             if os.path.exists(self.plugins_config_path):
-                with open(self.plugins_config_path, encoding="utf-8") as f:
-                    config_data = json.load(f)
+                with open(self.plugins_config_path, "rb") as f:
+                    config_data = _loads(f.read())
 
                 openapi_info = config_data.get("openapi_info", {})
                 current_enabled = openapi_info.get("enabled", False)
@@ -267,8 +401,8 @@ class JSPluginManager:
         """更新开放接口地址"""
         try:
             if os.path.exists(self.plugins_config_path):
-                with open(self.plugins_config_path, encoding="utf-8") as f:
-                    config_data = json.load(f)
+                with open(self.plugins_config_path, "rb") as f:
+                    config_data = _loads(f.read())
 
                 openapi_info = config_data.get("openapi_info", {})
                 openapi_info["search_url"] = openapi_url
@@ -307,8 +441,8 @@ class JSPluginManager:
         """更新订阅源"""
         try:
             if os.path.exists(self.plugins_config_path):
-                with open(self.plugins_config_path, encoding="utf-8") as f:
-                    config_data = json.load(f)
+                with open(self.plugins_config_path, "rb") as f:
+                    config_data = _loads(f.read())
                 plugin_source = config_data.get("plugin_source", {})
                 source_url = plugin_source.get("source_url", "")
                 if source_url:
@@ -353,6 +487,8 @@ class JSPluginManager:
             return False
 
         all_success = True
+        # 插件名 -> 下载地址；同名插件只保留最后一个，避免多个线程同时写同一个插件文件
+        downloads: dict[str, str] = {}
 
         for plugin_info in plugins_array:
             if (
@@ -372,8 +508,19 @@ class JSPluginManager:
                 all_success = False
                 continue
 
-            # 调用单个插件下载方法
-            success = self.download_single_plugin(plugin_name, plugin_url)
+            downloads[plugin_name] = plugin_url
+
+        if not downloads:
+            return all_success
+        # 并发下载，总耗时约为最慢插件的下载时间；配置文件的写入由 _config_lock 串行化
+        with ThreadPoolExecutor(
+            max_workers=min(_DOWNLOAD_WORKERS, len(downloads)),
+            thread_name_prefix="js-plugin-download",
+        ) as executor:
+            results = list(
+                executor.map(self.download_single_plugin, downloads, downloads.values())
+            )
+        for plugin_name, success in zip(downloads, results, strict=True):
             if not success:
                 all_success = False
                 self.log.error(f"Failed to download plugin: {plugin_name}")
@@ -403,10 +550,10 @@ class JSPluginManager:
 
         # 生成文件路径
         plugin_filename = f"{plugin_name}.js"
-        file_path = os.path.join(self.plugins_dir, plugin_filename)
+        file_path = self._plugin_path_prefix + plugin_filename
 
         # 检查是否已存在同名插件
-        if os.path.exists(file_path):
+        if self.has_plugin(plugin_name):
             self.log.warning(f"Plugin {plugin_name} already exists, will overwrite")
 
         try:
@@ -425,6 +572,7 @@ class JSPluginManager:
                 f.write(content)
 
             self.log.info(f"Successfully downloaded and saved plugin: {plugin_name}")
+            self.refresh_plugin_index()
 
             # 更新插件配置
             self.update_plugin_config(plugin_name, plugin_filename)
@@ -443,8 +591,8 @@ class JSPluginManager:
         """更新开放接口地址"""
         try:
             if os.path.exists(self.plugins_config_path):
-                with open(self.plugins_config_path, encoding="utf-8") as f:
-                    config_data = json.load(f)
+                with open(self.plugins_config_path, "rb") as f:
+                    config_data = _loads(f.read())
 
                 plugin_source = config_data.get("plugin_source", {})
                 plugin_source["source_url"] = source_url
@@ -465,45 +613,61 @@ class JSPluginManager:
     """----------------------------------------------------------------------"""
 
     def _get_config_data(self):
-        """获取配置数据，使用缓存机制"""
-        current_time = time.time()
-        # 检查缓存是否有效
-        if (
-            self._config_cache is not None
-            and current_time - self._config_cache_time < self._config_cache_ttl
-        ):
-            return self._config_cache
-
-        # 重新读取配置文件
-        if os.path.exists(self.plugins_config_path):
-            with open(self.plugins_config_path, encoding="utf-8") as f:
-                config_data = json.load(f)
-        else:
-            config_data = {}
+        """获取配置数据，使用缓存机制
+
+        缓存按 (配置文件路径, mtime) 区分，配置文件被修改（包括手动编辑）后自动重新读取，
+        未修改时只需一次 stat。监控运行期间配置文件的任何变化都会使缓存失效，连 stat 也省去。
+        """
+        watched = self._watched_config
+        if watched is not None:
+            return watched
+        generation = self._config_generation
 
-        # 更新缓存
-        self._config_cache = config_data
-        self._config_cache_time = current_time
+        path = self.plugins_config_path
+        try:
+            key = (path, os.stat(path).st_mtime_ns)
+        except FileNotFoundError:
+            return {}
+        config_data = _CONFIG_CACHE.get(key)
+        if config_data is None:
+            # 重新读取配置文件
+            with open(path, "rb") as f:
+                config_data = _loads(f.read())
+
+            # 更新缓存，同一路径只保留最新的一份
+            self._drop_cached_config()
+            _CONFIG_CACHE[key] = config_data
+
+        # 读取期间配置发生变化时不记住这份数据，否则会一直用旧配置直到下次变化
+        if self._observer and generation == self._config_generation:
+            self._watched_config = config_data
         return config_data
 
     def _invalidate_config_cache(self):
-        """使配置缓存失效"""
-        self._config_cache = None
-        self._config_cache_time = 0
+        """使配置缓存失效
+
+        文件系统的 mtime 精度不足时，同一时刻的两次写入 mtime 相同，因此写配置后仍需显式失效。
+        """
+        self._config_generation += 1
+        self._watched_config = None
+        self._drop_cached_config()
+
+    def _drop_cached_config(self):
+        """从 _CONFIG_CACHE 中移除本配置文件的缓存"""
+        # 先用 list() 拍快照：其它线程可能同时写入缓存，直接遍历字典会抛 RuntimeError
+        for key in list(_CONFIG_CACHE):
+            if key[0] == self.plugins_config_path:
+                _CONFIG_CACHE.pop(key, None)
 
     def _load_plugins(self):
         """加载所有插件"""
-        if not os.path.exists(self.plugins_dir):
-            os.makedirs(self.plugins_dir)
+        os.makedirs(self.plugins_dir, exist_ok=True)
 
         # 读取、加载插件配置Json
         if not os.path.exists(self.plugins_config_path):
             # 复制 plugins-config-example.json 模板，创建插件配置Json文件
-            example_config_path = os.path.join(
-                os.path.dirname(__file__), "plugins-config-example.json"
-            )
-            if os.path.exists(example_config_path):
-                shutil.copy2(example_config_path, self.plugins_config_path)
+            if os.path.exists(_EXAMPLE_CONFIG_PATH):
+                shutil.copy2(_EXAMPLE_CONFIG_PATH, self.plugins_config_path)
             else:
                 base_config = {
                     "account": "",
@@ -511,71 +675,116 @@ class JSPluginManager:
                     "auto_add_song": True,
                     "aiapi_info": {"enabled": False, "api_key": ""},
                     "enabled_plugins": [],
+                    "search_concurrency": 8,
                     "openapi_info": {"enabled": False, "search_url": ""},
                     "plugin_source": {"source_url": ""},
                     "plugins_info": [],
                 }
                 with open(self.plugins_config_path, "w", encoding="utf-8") as f:
                     json.dump(base_config, f, ensure_ascii=False, indent=2)
+        # 重建插件索引（即使监控在运行也要重建：上传插件后会立即重新加载，文件事件可能还没到达）
+        self.refresh_plugin_index()
         # 输出文件夹、配置文件地址
         self.log.info(f"Plugins directory: {self.plugins_dir}")
         self.log.info(f"Plugins config file: {self.plugins_config_path}")
         # 只加载指定的插件，避免加载所有插件导致超时
         # enabled_plugins = ['kw', 'qq-yuanli']  # 可以根据需要添加更多
         # 读取配置文件配置
-        enabled_plugins = self.get_enabled_plugins()
-        for filename in os.listdir(self.plugins_dir):
-            if filename.endswith(".js"):
-                plugin_name = os.path.splitext(filename)[0]
-                try:
-                    # 如果是重要插件或没有指定重要插件列表，则加载
-                    if not enabled_plugins or plugin_name in enabled_plugins:
-                        try:
-                            self.log.info(f"Loading plugin: {plugin_name}")
-                            self.load_plugin(plugin_name)
-                        except Exception as e:
-                            self.log.error(
-                                f"Failed to load important plugin {plugin_name}: {e}"
-                            )
-                            # 即使加载失败也记录插件信息
-                            self.plugins[plugin_name] = {
-                                "name": plugin_name,
-                                "enabled": False,
-                                "loaded": False,
-                                "error": str(e),
-                            }
-                    else:
-                        self.log.debug(
-                            f"Skipping plugin (not in important list): {plugin_name}"
-                        )
-                        # 标记为未加载但可用
-                        self.plugins[plugin_name] = {
-                            "name": plugin_name,
-                            "enabled": False,
-                            "loaded": False,
-                            "error": "Not loaded (not in important plugins list)",
-                        }
-                except Exception as e:
-                    self.log.error(f"Failed to load plugin {filename}: {e}")
-                    # 即使加载失败也记录插件信息
-                    self.plugins[plugin_name] = {
-                        "name": plugin_name,
-                        "enabled": False,
-                        "loaded": False,
-                        "error": str(e),
-                    }
+        # 开放接口不是 JS 插件，不参与判断；只启用了开放接口时仍按"未指定"加载所有插件
+        enabled_plugins = [
+            name for name in self.get_enabled_plugins() if name != "OpenAPI"
+        ]
+        for plugin_name in self.get_available_plugins():
+            # 如果是重要插件或没有指定重要插件列表，则加载
+            if enabled_plugins and plugin_name not in enabled_plugins:
+                self.log.debug(
+                    f"Skipping plugin (not in important list): {plugin_name}"
+                )
+                # 标记为未加载但可用
+                self.plugins[plugin_name] = {
+                    "name": plugin_name,
+                    "enabled": False,
+                    "loaded": False,
+                    "error": "Not loaded (not in important plugins list)",
+                }
+                continue
+            try:
+                self.log.info(f"Loading plugin: {plugin_name}")
+                self.load_plugin(plugin_name)
+            except Exception as e:
+                self.log.error(
+                    f"Failed to load important plugin {plugin_name}: {e}",
+                    exc_info=self.log.isEnabledFor(logging.DEBUG),
+                )
+                # 即使加载失败也记录插件信息
+                self.plugins[plugin_name] = {
+                    "name": plugin_name,
+                    "enabled": False,
+                    "loaded": False,
+                    "error": str(e),
+                }
+
+    def refresh_plugin_index(self) -> list[str]:
+        """重新扫描插件目录，重建插件索引
+
+        插件目录只在下载、上传、卸载、重新加载插件时变化，这些写操作之后调用本方法，
+        查询插件是否存在时直接查索引，无需访问文件系统。
+        """
+        try:
+            # 扫描时顺便记下插件文件路径，加载插件时无需再拼接路径
+            with os.scandir(self.plugins_dir) as entries:
+                # DirEntry.is_file() 使用扫描目录时得到的文件类型，普通文件无需额外 stat
+                plugin_paths = {
+                    entry.name[:-3]: entry.path
+                    for entry in entries
+                    if entry.name.endswith(".js") and entry.is_file()
+                }
+        except FileNotFoundError:
+            plugin_paths = {}
+        self._plugin_paths = plugin_paths
+        return list(plugin_paths)
+
+    def get_available_plugins(self) -> list[str]:
+        """获取插件目录下的所有插件名（来自插件索引）"""
+        return list(self._plugin_paths)
+
+    def _plugin_file_path(self, plugin_name: str) -> str:
+        """获取插件文件路径，优先取插件索引中的路径"""
+        try:
+            return self._plugin_paths[plugin_name]
+        except KeyError:
+            # 尚未扫描到的插件（如刚上传），按约定路径拼接
+            return f"{self._plugin_path_prefix}{plugin_name}.js"
+
+    def has_plugin(self, plugin_name: str) -> bool:
+        """插件文件是否存在（来自插件索引）"""
+        return plugin_name in self._plugin_paths
 
     def load_plugin(self, plugin_name: str) -> bool:
-        """加载单个插件"""
-        plugin_file = os.path.join(self.plugins_dir, f"{plugin_name}.js")
+        """加载单个插件
+
+        同一插件的加载按插件加锁串行执行：并发的重新加载（如同时启用插件和上传插件）
+        等待进行中的加载完成后直接复用结果，不会把同一份插件代码重复发送给 Node.js 进程。
+        """
+        lock = self._load_locks.setdefault(plugin_name, threading.Lock())
+        with lock:
+            if self.plugins.get(plugin_name, {}).get("status") == "loaded":
+                self.log.debug(f"JS plugin already loaded: {plugin_name}")
+                return True
+            return self._load_plugin(plugin_name)
 
-        if not os.path.exists(plugin_file):
-            raise FileNotFoundError(f"Plugin file not found: {plugin_file}")
+    def _load_plugin(self, plugin_name: str) -> bool:
+        """读取插件文件并发送给 Node.js 进程加载"""
+        plugin_file = self._plugin_file_path(plugin_name)
 
+        # 直接打开文件，不存在时由 open 抛错，省去一次 stat
         try:
             with open(plugin_file, encoding="utf-8") as f:
                 js_code = f.read()
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Plugin file not found: {plugin_file}") from None
 
+        try:
             response = self._send_message(
                 {"action": "load", "name": plugin_name, "code": js_code}
             )
@@ -595,7 +804,11 @@ class JSPluginManager:
                 return False
 
         except Exception as e:
-            self.log.error(f"Failed to load JS plugin {plugin_name}: {e}")
+            # 只有开启 DEBUG 日志时才附带堆栈
+            self.log.error(
+                f"Failed to load JS plugin {plugin_name}: {e}",
+                exc_info=self.log.isEnabledFor(logging.DEBUG),
+            )
             return False
 
     def refresh_plugin_list(self) -> list[dict[str, Any]]:
@@ -670,53 +883,64 @@ class JSPluginManager:
             self.log.error(f"Failed to read enabled plugins from config: {e}")
             return False
 
-    def search(self, plugin_name: str, keyword: str, page: int = 1, limit: int = 20):
-        """搜索音乐"""
+    def get_search_concurrency(self) -> int:
+        """获取同时进行的插件搜索数量上限"""
+        try:
+            config_data = self._get_config_data()
+            if config_data:
+                return max(1, int(config_data.get("search_concurrency", 8)))
+            return 8
+        except Exception as e:
+            self.log.error(f"Failed to read search concurrency from config: {e}")
+            return 8
+
+    def _call_plugin(
+        self, plugin_name: str, action: str, cached: bool = False, **payload
+    ):
+        """调用插件方法的通用流程
+
+        检查插件是否已加载、发送请求、校验响应，成功时返回 result，失败时抛出异常。
+
+        Args:
+            plugin_name: 插件名称
+            action: Node.js 运行器中的动作名（如 search、getLyric）
+            cached: 是否走只读请求的结果缓存
+            **payload: 随请求发送的其他字段
+        """
         if plugin_name not in self.plugins:
             raise ValueError(f"Plugin {plugin_name} not found or not loaded")
 
-        self.log.info(
-            f"JS Plugin Manager starting search in plugin {plugin_name} for keyword: {keyword}"
-        )
-        response = self._send_message(
-            {
-                "action": "search",
-                "pluginName": plugin_name,
-                "params": {"keywords": keyword, "page": page, "limit": limit},
-            }
-        )
-
-        self.log.debug(
-            f"JS Plugin Manager search response: {response}"
-        )  # 使用 debug 级别，减少日志量
+        message = {"action": action, "pluginName": plugin_name, **payload}
+        if cached:
+            response = self._send_cached_message(message)
+        else:
+            response = self._send_message(message)
 
         if not response["success"]:
             self.log.error(
-                f"JS Plugin Manager search failed in plugin {plugin_name}: {response['error']}"
+                f"JS Plugin Manager {action} failed in plugin {plugin_name}: {response['error']}"
             )
-            # 添加详细的错误信息
-            self.log.error(f"JS Plugin Manager full error response: {response}")
-            raise Exception(f"Search failed: {response['error']}")
-        else:
-            # 检查返回的数据结构
-            result_data = response["result"]
-            self.log.debug(
-                f"JS Plugin Manager search raw result: {result_data}"
-            )  # 使用 debug 级别
-            data_list = result_data.get("data", [])
-            is_end = result_data.get("isEnd", True)
-            self.log.info(
-                f"JS Plugin Manager search completed in plugin {plugin_name}, isEnd: {is_end}, found {len(data_list)} results"
-            )
-            # 检查数据类型是否正确
-            if not isinstance(data_list, list):
-                self.log.error(
-                    f"JS Plugin Manager search returned invalid data type: {type(data_list)}, value: {data_list}"
-                )
-            else:
-                self.log.debug(
-                    f"JS Plugin Manager search data sample: {data_list[:2] if len(data_list) > 0 else 'No results'}"
-                )
+            raise Exception(f"{action} failed: {response['error']}")
+        return response["result"]
+
+    def search(self, plugin_name: str, keyword: str, page: int = 1, limit: int = 20):
+        """搜索音乐"""
+        self.log.info(
+            f"JS Plugin Manager starting search in plugin {plugin_name} for keyword: {keyword}"
+        )
+        result_data = self._call_plugin(
+            plugin_name,
+            "search",
+            cached=True,
+            params={"keywords": keyword, "page": page, "limit": limit},
+        )
+        if self.log.isEnabledFor(logging.DEBUG):
+            self.log.debug(f"JS Plugin Manager search raw result: {result_data}")
+        data_list = result_data.get("data", [])
+        is_end = result_data.get("isEnd", True)
+        self.log.info(
+            f"JS Plugin Manager search completed in plugin {plugin_name}, isEnd: {is_end}, found {len(data_list)} results"
+        )
         return result_data
 
     async def openapi_search(
@@ -736,20 +960,24 @@ class JSPluginManager:
 
         import aiohttp
 
+        from xiaomusic.utils.network_utils import get_shared_session
+
         try:
             # 构造请求参数
             params = {"type": "aggregateSearch", "keyword": keyword, "limit": limit}
-            # 使用aiohttp发起异步HTTP GET请求
-            connector = aiohttp.TCPConnector(ssl=False)  # 跳过 SSL 验证
-            async with aiohttp.ClientSession(connector=connector) as session:
-                async with session.get(
-                    url, params=params, timeout=aiohttp.ClientTimeout(total=10)
-                ) as response:
-                    response.raise_for_status()  # 抛出HTTP错误
-                    # 解析响应数据
-                    raw_data = await response.json()
-
-            self.log.info(f"在线接口返回Json: {raw_data}")
+            # 使用共享的aiohttp会话发起异步HTTP GET请求，复用连接
+            async with get_shared_session().get(
+                url,
+                params=params,
+                ssl=False,  # 跳过 SSL 验证
+                timeout=aiohttp.ClientTimeout(total=10),
+            ) as response:
+                response.raise_for_status()  # 抛出HTTP错误
+                # 解析响应数据
+                raw_data = await response.json()
+
+            if self.log.isEnabledFor(logging.DEBUG):
+                self.log.debug(f"在线接口返回Json: {raw_data}")
 
             # 检查API调用是否成功
             if raw_data.get("code") != 200:
@@ -763,9 +991,11 @@ class JSPluginManager:
 
             # 转换数据格式以匹配插件系统的期望格式
             converted_data = []
+            debug = self.log.isEnabledFor(logging.DEBUG)
             for item in results:
                 url = item.get("url", "")
-                self.log.info(f"openapi_search url: {url}")
+                if debug:
+                    self.log.debug(f"openapi_search url: {url}")
                 converted_item = {
                     "id": item.get("id", ""),
                     "title": item.get("name", ""),
@@ -904,137 +1134,62 @@ class JSPluginManager:
             return title_score + artist_score + platform_bonus
 
         sorted_data = sorted(data_list, key=calculate_match_score, reverse=True)
-        self.log.info(f"排序后列表信息：：{sorted_data}")
+        if self.log.isEnabledFor(logging.DEBUG):
+            self.log.debug(f"排序后列表信息：：{sorted_data}")
         if 0 < limit < len(sorted_data):
             sorted_data = sorted_data[:limit]
         result_data["data"] = sorted_data
         return result_data
 
-    def get_media_source(self, plugin_name: str, music_item: dict[str, Any], quality):
+    def get_media_source(
+        self, plugin_name: str, music_item: dict[str, Any], quality: str = "standard"
+    ):
         """获取媒体源"""
-        if plugin_name not in self.plugins:
-            raise ValueError(f"Plugin {plugin_name} not found or not loaded")
-
         self.log.debug(
             f"JS Plugin Manager getting media source in plugin {plugin_name} for item: {music_item.get('title', 'unknown')} by {music_item.get('artist', 'unknown')}"
         )
-        response = self._send_message(
-            {
-                "action": "getMediaSource",
-                "pluginName": plugin_name,
-                "musicItem": music_item,
-                "quality": quality,
-            }
+        return self._call_plugin(
+            plugin_name, "getMediaSource", musicItem=music_item, quality=quality
         )
 
-        if not response["success"]:
-            self.log.error(
-                f"JS Plugin Manager getMediaSource failed in plugin {plugin_name}: {response['error']}"
-            )
-            raise Exception(f"getMediaSource failed: {response['error']}")
-        else:
-            self.log.debug(
-                f"JS Plugin Manager getMediaSource completed in plugin {plugin_name}, URL length: {len(response['result'].get('url', '')) if response['result'] else 0}"
-            )
-
-        return response["result"]
-
     def get_lyric(self, plugin_name: str, music_item: dict[str, Any]):
         """获取歌词"""
-        if plugin_name not in self.plugins:
-            raise ValueError(f"Plugin {plugin_name} not found or not loaded")
-
         self.log.debug(
             f"JS Plugin Manager getting lyric in plugin {plugin_name} for music: {music_item.get('title', 'unknown')}"
         )
-        response = self._send_message(
-            {"action": "getLyric", "pluginName": plugin_name, "musicItem": music_item}
+        return self._call_plugin(
+            plugin_name, "getLyric", cached=True, musicItem=music_item
         )
 
-        if not response["success"]:
-            self.log.error(
-                f"JS Plugin Manager getLyric failed in plugin {plugin_name}: {response['error']}"
-            )
-            raise Exception(f"getLyric failed: {response['error']}")
-
-        return response["result"]
-
     def get_music_info(self, plugin_name: str, music_item: dict[str, Any]):
         """获取音乐详情"""
-        if plugin_name not in self.plugins:
-            raise ValueError(f"Plugin {plugin_name} not found or not loaded")
-
         self.log.debug(
             f"JS Plugin Manager getting music info in plugin {plugin_name} for music: {music_item.get('title', 'unknown')}"
         )
-        response = self._send_message(
-            {
-                "action": "getMusicInfo",
-                "pluginName": plugin_name,
-                "musicItem": music_item,
-            }
-        )
-
-        if not response["success"]:
-            self.log.error(
-                f"JS Plugin Manager getMusicInfo failed in plugin {plugin_name}: {response['error']}"
-            )
-            raise Exception(f"getMusicInfo failed: {response['error']}")
-
-        return response["result"]
+        return self._call_plugin(plugin_name, "getMusicInfo", musicItem=music_item)
 
     def get_album_info(
         self, plugin_name: str, album_info: dict[str, Any], page: int = 1
     ):
         """获取专辑详情"""
-        if plugin_name not in self.plugins:
-            raise ValueError(f"Plugin {plugin_name} not found or not loaded")
-
         self.log.debug(
             f"JS Plugin Manager getting album info in plugin {plugin_name} for album: {album_info.get('title', 'unknown')}"
         )
-        response = self._send_message(
-            {
-                "action": "getAlbumInfo",
-                "pluginName": plugin_name,
-                "albumInfo": album_info,
-            }
+        return self._call_plugin(
+            plugin_name, "getAlbumInfo", cached=True, albumInfo=album_info
         )
 
-        if not response["success"]:
-            self.log.error(
-                f"JS Plugin Manager getAlbumInfo failed in plugin {plugin_name}: {response['error']}"
-            )
-            raise Exception(f"getAlbumInfo failed: {response['error']}")
-
-        return response["result"]
-
     def get_music_sheet_info(
         self, plugin_name: str, playlist_info: dict[str, Any], page: int = 1
     ):
         """获取歌单详情"""
-        if plugin_name not in self.plugins:
-            raise ValueError(f"Plugin {plugin_name} not found or not loaded")
-
         self.log.debug(
             f"JS Plugin Manager getting music sheet info in plugin {plugin_name} for playlist: {playlist_info.get('title', 'unknown')}"
         )
-        response = self._send_message(
-            {
-                "action": "getMusicSheetInfo",
-                "pluginName": plugin_name,
-                "playlistInfo": playlist_info,
-            }
+        return self._call_plugin(
+            plugin_name, "getMusicSheetInfo", playlistInfo=playlist_info
         )
 
-        if not response["success"]:
-            self.log.error(
-                f"JS Plugin Manager getMusicSheetInfo failed in plugin {plugin_name}: {response['error']}"
-            )
-            raise Exception(f"getMusicSheetInfo failed: {response['error']}")
-
-        return response["result"]
-
     def get_artist_works(
         self,
         plugin_name: str,
@@ -1043,123 +1198,48 @@ class JSPluginManager:
         type_: str = "music",
     ):
         """获取作者作品"""
-        if plugin_name not in self.plugins:
-            raise ValueError(f"Plugin {plugin_name} not found or not loaded")
-
         self.log.debug(
             f"JS Plugin Manager getting artist works in plugin {plugin_name} for artist: {artist_item.get('title', 'unknown')}"
         )
-        response = self._send_message(
-            {
-                "action": "getArtistWorks",
-                "pluginName": plugin_name,
-                "artistItem": artist_item,
-                "page": page,
-                "type": type_,
-            }
+        return self._call_plugin(
+            plugin_name,
+            "getArtistWorks",
+            cached=True,
+            artistItem=artist_item,
+            page=page,
+            type=type_,
         )
 
-        if not response["success"]:
-            self.log.error(
-                f"JS Plugin Manager getArtistWorks failed in plugin {plugin_name}: {response['error']}"
-            )
-            raise Exception(f"getArtistWorks failed: {response['error']}")
-
-        return response["result"]
-
     def import_music_item(self, plugin_name: str, url_like: str):
         """导入单曲"""
-        if plugin_name not in self.plugins:
-            raise ValueError(f"Plugin {plugin_name} not found or not loaded")
-
         self.log.debug(
             f"JS Plugin Manager importing music item in plugin {plugin_name} from: {url_like}"
         )
-        response = self._send_message(
-            {
-                "action": "importMusicItem",
-                "pluginName": plugin_name,
-                "urlLike": url_like,
-            }
-        )
-
-        if not response["success"]:
-            self.log.error(
-                f"JS Plugin Manager importMusicItem failed in plugin {plugin_name}: {response['error']}"
-            )
-            raise Exception(f"importMusicItem failed: {response['error']}")
-
-        return response["result"]
+        return self._call_plugin(plugin_name, "importMusicItem", urlLike=url_like)
 
     def import_music_sheet(self, plugin_name: str, url_like: str):
         """导入歌单"""
-        if plugin_name not in self.plugins:
-            raise ValueError(f"Plugin {plugin_name} not found or not loaded")
-
         self.log.debug(
             f"JS Plugin Manager importing music sheet in plugin {plugin_name} from: {url_like}"
         )
-        response = self._send_message(
-            {
-                "action": "importMusicSheet",
-                "pluginName": plugin_name,
-                "urlLike": url_like,
-            }
-        )
-
-        if not response["success"]:
-            self.log.error(
-                f"JS Plugin Manager importMusicSheet failed in plugin {plugin_name}: {response['error']}"
-            )
-            raise Exception(f"importMusicSheet failed: {response['error']}")
-
-        return response["result"]
+        return self._call_plugin(plugin_name, "importMusicSheet", urlLike=url_like)
 
     def get_top_lists(self, plugin_name: str):
         """获取榜单列表"""
-        if plugin_name not in self.plugins:
-            raise ValueError(f"Plugin {plugin_name} not found or not loaded")
-
         self.log.debug(f"JS Plugin Manager getting top lists in plugin {plugin_name}")
-        response = self._send_message(
-            {"action": "getTopLists", "pluginName": plugin_name}
-        )
-
-        if not response["success"]:
-            self.log.error(
-                f"JS Plugin Manager getTopLists failed in plugin {plugin_name}: {response['error']}"
-            )
-            raise Exception(f"getTopLists failed: {response['error']}")
-
-        return response["result"]
+        return self._call_plugin(plugin_name, "getTopLists")
 
     def get_top_list_detail(
         self, plugin_name: str, top_list_item: dict[str, Any], page: int = 1
     ):
         """获取榜单详情"""
-        if plugin_name not in self.plugins:
-            raise ValueError(f"Plugin {plugin_name} not found or not loaded")
-
         self.log.debug(
             f"JS Plugin Manager getting top list detail in plugin {plugin_name} for list: {top_list_item.get('title', 'unknown')}"
         )
-        response = self._send_message(
-            {
-                "action": "getTopListDetail",
-                "pluginName": plugin_name,
-                "topListItem": top_list_item,
-                "page": page,
-            }
+        return self._call_plugin(
+            plugin_name, "getTopListDetail", topListItem=top_list_item, page=page
         )
 
-        if not response["success"]:
-            self.log.error(
-                f"JS Plugin Manager getTopListDetail failed in plugin {plugin_name}: {response['error']}"
-            )
-            raise Exception(f"getTopListDetail failed: {response['error']}")
-
-        return response["result"]
-
     # 启用插件
     def enable_plugin(self, plugin_name: str) -> bool:
         if plugin_name in self.plugins:
@@ -1172,8 +1252,8 @@ class JSPluginManager:
 
                 # 读取现有配置
                 if os.path.exists(config_file_path):
-                    with open(config_file_path, encoding="utf-8") as f:
-                        config_data = json.load(f)
+                    with open(config_file_path, "rb") as f:
+                        config_data = _loads(f.read())
 
                     # 更新plugins_info中对应插件的状态
                     for plugin_info in config_data.get("plugins_info", []):
@@ -1219,8 +1299,8 @@ class JSPluginManager:
 
             # 读取现有配置
             if os.path.exists(config_file_path):
-                with open(config_file_path, encoding="utf-8") as f:
-                    config_data = json.load(f)
+                with open(config_file_path, "rb") as f:
+                    config_data = _loads(f.read())
 
                 # 更新plugins_info中对应插件的状态
                 for plugin_info in config_data.get("plugins_info", []):
@@ -1263,8 +1343,8 @@ class JSPluginManager:
 
                 # 读取现有配置
                 if os.path.exists(config_file_path):
-                    with open(config_file_path, encoding="utf-8") as f:
-                        config_data = json.load(f)
+                    with open(config_file_path, "rb") as f:
+                        config_data = _loads(f.read())
 
                     # 移除plugins_info属性中对应的插件项目
                     if "plugins_info" in config_data:
@@ -1291,12 +1371,13 @@ class JSPluginManager:
                     )
 
                 # 删除插件文件夹中的指定插件文件
-                plugin_file_path = os.path.join(self.plugins_dir, f"{plugin_name}.js")
-                if os.path.exists(plugin_file_path):
+                plugin_file_path = self._plugin_file_path(plugin_name)
+                try:
                     os.remove(plugin_file_path)
                     self.log.info(f"Plugin file removed: {plugin_file_path}")
-                else:
+                except FileNotFoundError:
                     self.log.warning(f"Plugin file not found: {plugin_file_path}")
+                self._plugin_paths.pop(plugin_name, None)
 
                 return True
             except Exception as e:
@@ -1307,60 +1388,114 @@ class JSPluginManager:
     def reload_plugins(self):
         """重新加载所有插件"""
         self.log.info("Reloading all plugins...")
-        # 清空现有插件状态
+        # 清空现有插件状态及插件请求结果缓存
         self.plugins.clear()
+        self._invalidate_rpc_cache()
         # 重新加载插件
         self._load_plugins()
         self.log.info(f"最新插件信息：{self.plugins}")
 
     def update_plugin_config(self, plugin_name: str, plugin_file: str):
-        """更新插件配置文件"""
+        """更新插件配置文件
+
+        读取-修改-写回配置文件期间持有 _config_lock，并发下载插件时不会互相覆盖。
+        """
         try:
-            # 使用自定义的配置文件路径
-            config_file_path = self.plugins_config_path
-            # 如果配置文件不存在，创建一个基础配置
-            if not os.path.exists(config_file_path):
-                base_config = {
-                    "account": "",
-                    "password": "",
-                    "enabled_plugins": [],
-                    "plugins_info": [],
-                }
-                with open(config_file_path, "w", encoding="utf-8") as f:
-                    json.dump(base_config, f, ensure_ascii=False, indent=2)
+            with self._config_lock:
+                self._update_plugin_config(plugin_name, plugin_file)
+            self.log.info(f"Plugin config updated for {plugin_name}")
+        except Exception as e:
+            self.log.error(f"Failed to update plugin config: {e}")
 
-            # 读取现有配置
-            with open(config_file_path, encoding="utf-8") as f:
-                config_data = json.load(f)
-
-            # 检查是否已存在该插件信息
-            plugin_exists = False
-            for plugin_info in config_data.get("plugins_info", []):
-                if plugin_info.get("name") == plugin_name:
-                    plugin_exists = True
-                    break
-
-            # 如果不存在，则添加新的插件信息
-            if not plugin_exists:
-                new_plugin_info = {
-                    "name": plugin_name,
-                    "file": plugin_file,
-                    "enabled": False,  # 默认不启用
-                }
-                if "plugins_info" not in config_data:
-                    config_data["plugins_info"] = []
-                config_data["plugins_info"].append(new_plugin_info)
-                # 写回配置文件
-                with open(config_file_path, "w", encoding="utf-8") as f:
-                    json.dump(config_data, f, ensure_ascii=False, indent=2)
+    def _update_plugin_config(self, plugin_name: str, plugin_file: str):
+        """在插件配置文件中登记插件信息（调用方需持有 _config_lock）"""
+        # 使用自定义的配置文件路径
+        config_file_path = self.plugins_config_path
+        # 如果配置文件不存在，创建一个基础配置
+        if not os.path.exists(config_file_path):
+            base_config = {
+                "account": "",
+                "password": "",
+                "enabled_plugins": [],
+                "plugins_info": [],
+            }
+            with open(config_file_path, "w", encoding="utf-8") as f:
+                json.dump(base_config, f, ensure_ascii=False, indent=2)
+
+        # 读取现有配置
+        with open(config_file_path, "rb") as f:
+            config_data = _loads(f.read())
+
+        # 检查是否已存在该插件信息
+        plugin_exists = False
+        for plugin_info in config_data.get("plugins_info", []):
+            if plugin_info.get("name") == plugin_name:
+                plugin_exists = True
+                break
 
-            self.log.info(f"Plugin config updated for {plugin_name}")
+        # 如果不存在，则添加新的插件信息
+        if not plugin_exists:
+            new_plugin_info = {
+                "name": plugin_name,
+                "file": plugin_file,
+                "enabled": False,  # 默认不启用
+            }
+            if "plugins_info" not in config_data:
+                config_data["plugins_info"] = []
+            config_data["plugins_info"].append(new_plugin_info)
+            # 写回配置文件
+            with open(config_file_path, "w", encoding="utf-8") as f:
+                json.dump(config_data, f, ensure_ascii=False, indent=2)
+            self._invalidate_config_cache()
+
+    def start_watch(self):
+        """监控插件目录及插件配置文件
+
+        插件文件增删时重建插件索引，配置文件变化时使配置缓存失效；
+        监控运行期间读取配置直接使用缓存，不再每次 stat 配置文件。
+        手动放入的插件文件只会出现在插件列表中，仍需在配置中启用并重新加载插件后才会加载。
+        """
+        if self._observer:
+            return
+
+        from watchdog.observers import Observer
 
+        from xiaomusic.file_watcher import PluginPathWatch
+
+        os.makedirs(self.plugins_dir, exist_ok=True)
+        handler = PluginPathWatch(
+            plugins_dir=self.plugins_dir,
+            config_path=self.plugins_config_path,
+            on_plugins_change=self.refresh_plugin_index,
+            on_config_change=self._invalidate_config_cache,
+        )
+        observer = Observer()
+        # 配置文件所在目录和插件目录都只监控第一层
+        observer.schedule(
+            handler, os.path.dirname(self.plugins_config_path), recursive=False
+        )
+        observer.schedule(handler, self.plugins_dir, recursive=False)
+        try:
+            observer.start()
         except Exception as e:
-            self.log.error(f"Failed to update plugin config: {e}")
+            # 监控只是锦上添花（如 inotify 数量达到上限），失败时不影响插件使用
+            self.log.warning(f"Failed to watch plugins directory: {e}")
+            return
+        self._observer = observer
+        self.log.info(f"已启动对插件目录 {self.plugins_dir} 的监控。")
+
+    def stop_watch(self):
+        """停止监控插件目录及插件配置文件"""
+        if self._observer:
+            self._observer.stop()
+            self._observer.join()
+            self._observer = None
+            self._invalidate_config_cache()
 
     def shutdown(self):
         """关闭插件管理器"""
+        self._is_shutting_down = True
+        self.stop_watch()
         if self.node_process:
             self.node_process.terminate()
             self.node_process.wait()
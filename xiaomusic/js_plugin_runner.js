@@ -6,12 +6,29 @@
  */
 
 const vm = require('vm');
-const fs = require('fs');
 
 // 设置编码
 process.stdin.setEncoding('utf8');
 process.stdout.setDefaultEncoding('utf8');
 
+// 消息动作 -> 处理函数，模块加载时构建一次，每条消息只需一次查表
+const ACTION_HANDLERS = new Map([
+    ['load', (runner, m) => runner.loadPlugin(m.name, m.code)],
+    ['search', (runner, m) => runner.search(m.pluginName, m.params)],
+    ['getMediaSource', (runner, m) => runner.callPluginMethod(m.pluginName, 'getMediaSource', [m.musicItem, m.quality])],
+    ['getLyric', (runner, m) => runner.callPluginMethod(m.pluginName, 'getLyric', [m.musicItem])],
+    ['getMusicInfo', (runner, m) => runner.callPluginMethod(m.pluginName, 'getMusicInfo', [m.musicItem])],
+    // 使用默认页码 1（从MusicFree官方文档得知默认为1）
+    ['getAlbumInfo', (runner, m) => runner.callPluginMethod(m.pluginName, 'getAlbumInfo', [m.albumInfo, 1])],
+    ['getMusicSheetInfo', (runner, m) => runner.callPluginMethod(m.pluginName, 'getMusicSheetInfo', [m.playlistInfo, 1])],
+    ['getArtistWorks', (runner, m) => runner.callPluginMethod(m.pluginName, 'getArtistWorks', [m.artistItem, m.page ?? 1, m.type ?? 'music'])],
+    ['importMusicItem', (runner, m) => runner.callPluginMethod(m.pluginName, 'importMusicItem', [m.urlLike])],
+    ['importMusicSheet', (runner, m) => runner.callPluginMethod(m.pluginName, 'importMusicSheet', [m.urlLike], true)],
+    ['getTopLists', (runner, m) => runner.callPluginMethod(m.pluginName, 'getTopLists', [], true)],
+    ['getTopListDetail', (runner, m) => runner.callPluginMethod(m.pluginName, 'getTopListDetail', [m.topListItem, m.page ?? 1])],
+    ['unload', (runner, m) => runner.unloadPlugin(m.name)],
+]);
+
 class PluginRunner {
     constructor() {
         this.plugins = new Map();
@@ -33,7 +50,7 @@ class PluginRunner {
                 if (line.trim() === '') continue;
                 try {
                     const message = JSON.parse(line.trim());
-                    console.log(`[JS_PLUGIN_RUNNER] Raw message received: ${line.trim()}`);
+                    // 不回显原始消息：load 消息携带完整插件源码，回显会占满 stdout 管道
                     this.handleMessage(message);
                 } catch (error) {
                     console.error(`[JS_PLUGIN_RUNNER] Failed to parse message: ${line.trim()}`);
@@ -56,52 +73,11 @@ class PluginRunner {
         // if (message.musicItem) console.debug(`[JS_PLUGIN_RUNNER] Music Item:`, message.musicItem);
 
         try {
-            let result;
-            switch (action) {
-                case 'load':
-                    console.log(`[JS_PLUGIN_RUNNER] Loading plugin: ${message.name}`);
-                    result = this.loadPlugin(message.name, message.code);
-                    break;
-                case 'search':
-                    result = await this.search(message.pluginName, message.params);
-                    break;
-                case 'getMediaSource':
-                    result = await this.getMediaSource(message.pluginName, message.musicItem, message.quality);
-                    break;
-                case 'getLyric':
-                    result = await this.getLyric(message.pluginName, message.musicItem);
-                    break;
-                case 'getMusicInfo':
-                    result = await this.getMusicInfo(message.pluginName, message.musicItem);
-                    break;
-                case 'getAlbumInfo':
-                    result = await this.getAlbum(message.pluginName, message.albumInfo);
-                    break;
-                case 'getMusicSheetInfo':
-                    result = await this.getPlaylist(message.pluginName, message.playlistInfo);
-                    break;
-                case 'getArtistWorks':
-                    result = await this.getArtistWorks(message.pluginName, message.artistItem, message.page, message.type);
-                    break;
-                case 'importMusicItem':
-                    result = await this.importMusicItem(message.pluginName, message.urlLike);
-                    break;
-                case 'importMusicSheet':
-                    result = await this.importMusicSheet(message.pluginName, message.urlLike);
-                    break;
-                case 'getTopLists':
-                    result = await this.getTopLists(message.pluginName);
-                    break;
-                case 'getTopListDetail':
-                    result = await this.getTopListDetail(message.pluginName, message.topListItem, message.page);
-                    break;
-                case 'unload':
-                    console.log(`[JS_PLUGIN_RUNNER] Unloading plugin: ${message.name}`);
-                    result = this.unloadPlugin(message.name);
-                    break;
-                default:
-                    throw new Error(`Unknown action: ${action}`);
+            const handler = ACTION_HANDLERS.get(action);
+            if (!handler) {
+                throw new Error(`Unknown action: ${action}`);
             }
+            const result = await handler(this, message);
 
             this.sendResponse(id, { success: true, result });
         } catch (error) {
@@ -268,8 +244,7 @@ class PluginRunner {
 
         // 检查插件是否有 search 方法 - 参考 MusicFreeDesktop 实现
         if (!plugin.search || typeof plugin.search !== 'function') {
-            // 只在详细模式下输出调试信息
-            console.debug(`[JS_PLUGIN_RUNNER] Plugin ${pluginName} does not have a search function`);
+            // 不输出调试信息：console.debug 会写入 stdout，干扰 JSON 通信
             return {
                 isEnd: true,
                 data: []
@@ -296,9 +271,6 @@ class PluginRunner {
             // console.debug(`[JS_PLUGIN_RUNNER] Calling search with query: ${query}, page: ${page}, type: ${type}`);
             const result = await plugin.search(query, page, type);
 
-            // 将调试信息写入日志文件而不是控制台
-            fs.appendFileSync('00-plugin_debug.log', `===========================${pluginName}插件原始返回结果：===================================\n`);
-            fs.appendFileSync('00-plugin_debug.log', `${JSON.stringify(result, null, 2)}\n`);
             // 严格验证返回结果 - 参考 MusicFreeDesktop 实现
             if (!result || typeof result !== 'object') {
                 console.error(`[JS_PLUGIN_RUNNER] Invalid search result from plugin ${pluginName}:`, typeof result);
@@ -324,295 +296,39 @@ class PluginRunner {
     }
 
 
-    async getMediaSource(pluginName, musicItem, quality) {
-        const plugin = this.plugins.get(pluginName);
-        if (!plugin) {
-            throw new Error(`Plugin ${pluginName} not found`);
-        }
-
-        // 检查插件是否有 getMediaSource 方法 - 参考 MusicFreeDesktop 实现
-        if (!plugin.getMediaSource || typeof plugin.getMediaSource !== 'function') {
-            // 不输出调试信息以避免干扰通信
-            return null;
-        }
-
-        try {
-            const result = await plugin.getMediaSource(musicItem,quality);
-            // 参考 MusicFreeDesktop 实现，验证结果
-            if (result === null || result === undefined) {
-                return null;
-            }
-            if (typeof result !== 'object') {
-                console.error(`[JS_PLUGIN_RUNNER] Invalid media source result from plugin ${pluginName}:`, typeof result);
-                throw new Error(`Plugin ${pluginName} returned invalid media source result`);
-            }
-            return result;
-        } catch (error) {
-            console.error(`[JS_PLUGIN_RUNNER] getMediaSource error in plugin ${pluginName}:`, error.message);
-            throw new Error(`getMediaSource failed in plugin ${pluginName}: ${error.message}`);
-        }
-    }
-
-    async getLyric(pluginName, songId) {
-        const plugin = this.plugins.get(pluginName);
-        if (!plugin) {
-            throw new Error(`Plugin ${pluginName} not found`);
-        }
-
-        // 检查插件是否有 getLyric 方法 - 参考 MusicFreeDesktop 实现
-        if (!plugin.getLyric || typeof plugin.getLyric !== 'function') {
-            // 不输出调试信息以避免干扰通信
-            return null;
-        }
-
-        try {
-            const result = await plugin.getLyric(songId);
-            // 参考 MusicFreeDesktop 实现，验证结果
-            if (result === null || result === undefined) {
-                return null;
-            }
-            if (typeof result !== 'object') {
-                console.error(`[JS_PLUGIN_RUNNER] Invalid lyric result from plugin ${pluginName}:`, typeof result);
-                throw new Error(`Plugin ${pluginName} returned invalid lyric result`);
-            }
-            return result;
-        } catch (error) {
-            console.error(`[JS_PLUGIN_RUNNER] getLyric error in plugin ${pluginName}:`, error.message);
-            throw new Error(`getLyric failed in plugin ${pluginName}: ${error.message}`);
-        }
-    }
-
-    async getAlbum(pluginName, albumInfo) {
-        const plugin = this.plugins.get(pluginName);
-        if (!plugin) {
-            throw new Error(`Plugin ${pluginName} not found`);
-        }
-
-        // 检查插件是否有 getAlbumInfo 方法 (按照官方文档标准)
-        if (!plugin.getAlbumInfo || typeof plugin.getAlbumInfo !== 'function') {
-            // 不输出调试信息以避免干扰通信
-            return null;
-        }
-
-        try {
-            // 使用默认页码 1（从MusicFree官方文档得知默认为1）
-            const result = await plugin.getAlbumInfo(albumInfo, 1);
-            // 参考 MusicFree 实现，验证结果
-            if (result === null || result === undefined) {
-                return null;
-            }
-            if (typeof result !== 'object') {
-                console.error(`[JS_PLUGIN_RUNNER] Invalid album result from plugin ${pluginName}:`, typeof result);
-                throw new Error(`Plugin ${pluginName} returned invalid album result`);
-            }
-            return result;
-        } catch (error) {
-            console.error(`[JS_PLUGIN_RUNNER] getAlbumInfo error in plugin ${pluginName}:`, error.message);
-            throw new Error(`getAlbumInfo failed in plugin ${pluginName}: ${error.message}`);
-        }
-    }
-
-    async getPlaylist(pluginName, playlistInfo) {
-        const plugin = this.plugins.get(pluginName);
-        if (!plugin) {
-            throw new Error(`Plugin ${pluginName} not found`);
-        }
-
-        // 检查插件是否有 getMusicSheetInfo 方法 (按照官方文档标准)
-        if (!plugin.getMusicSheetInfo || typeof plugin.getMusicSheetInfo !== 'function') {
-            // 不输出调试信息以避免干扰通信
-            return null;
-        }
-
-        try {
-            // 使用默认页码 1（从MusicFree官方文档得知默认为1）
-            const result = await plugin.getMusicSheetInfo(playlistInfo, 1);
-            // 参考 MusicFree 实现，验证结果
-            if (result === null || result === undefined) {
-                return null;
-            }
-            if (typeof result !== 'object') {
-                console.error(`[JS_PLUGIN_RUNNER] Invalid playlist result from plugin ${pluginName}:`, typeof result);
-                throw new Error(`Plugin ${pluginName} returned invalid playlist result`);
-            }
-            return result;
-        } catch (error) {
-            console.error(`[JS_PLUGIN_RUNNER] getMusicSheetInfo error in plugin ${pluginName}:`, error.message);
-            throw new Error(`getMusicSheetInfo failed in plugin ${pluginName}: ${error.message}`);
-        }
-    }
-
-    async getMusicInfo(pluginName, musicItem) {
-        const plugin = this.plugins.get(pluginName);
-        if (!plugin) {
-            throw new Error(`Plugin ${pluginName} not found`);
-        }
-
-        // 检查插件是否有 getMusicInfo 方法 (按照官方文档标准)
-        if (!plugin.getMusicInfo || typeof plugin.getMusicInfo !== 'function') {
-            // 不输出调试信息以避免干扰通信
-            return null;
-        }
-
-        try {
-            const result = await plugin.getMusicInfo(musicItem);
-            // 参考 MusicFree 实现，验证结果
-            if (result === null || result === undefined) {
-                return null;
-            }
-            if (typeof result !== 'object') {
-                console.error(`[JS_PLUGIN_RUNNER] Invalid music info result from plugin ${pluginName}:`, typeof result);
-                throw new Error(`Plugin ${pluginName} returned invalid music info result`);
-            }
-            return result;
-        } catch (error) {
-            console.error(`[JS_PLUGIN_RUNNER] getMusicInfo error in plugin ${pluginName}:`, error.message);
-            throw new Error(`getMusicInfo failed in plugin ${pluginName}: ${error.message}`);
-        }
-    }
-
-    async getArtistWorks(pluginName, artistItem, page = 1, type = 'music') {
-        const plugin = this.plugins.get(pluginName);
-        if (!plugin) {
-            throw new Error(`Plugin ${pluginName} not found`);
-        }
-
-        // 检查插件是否有 getArtistWorks 方法 (按照官方文档标准)
-        if (!plugin.getArtistWorks || typeof plugin.getArtistWorks !== 'function') {
-            // 不输出调试信息以避免干扰通信
-            return null;
-        }
-
-        try {
-            const result = await plugin.getArtistWorks(artistItem, page, type);
-            // 参考 MusicFree 实现，验证结果
-            if (result === null || result === undefined) {
-                return null;
-            }
-            if (typeof result !== 'object') {
-                console.error(`[JS_PLUGIN_RUNNER] Invalid artist works result from plugin ${pluginName}:`, typeof result);
-                throw new Error(`Plugin ${pluginName} returned invalid artist works result`);
-            }
-            return result;
-        } catch (error) {
-            console.error(`[JS_PLUGIN_RUNNER] getArtistWorks error in plugin ${pluginName}:`, error.message);
-            throw new Error(`getArtistWorks failed in plugin ${pluginName}: ${error.message}`);
-        }
-    }
-
-    async importMusicItem(pluginName, urlLike) {
-        const plugin = this.plugins.get(pluginName);
-        if (!plugin) {
-            throw new Error(`Plugin ${pluginName} not found`);
-        }
-
-        // 检查插件是否有 importMusicItem 方法 (按照官方文档标准)
-        if (!plugin.importMusicItem || typeof plugin.importMusicItem !== 'function') {
-            // 不输出调试信息以避免干扰通信
-            return null;
-        }
-
-        try {
-            const result = await plugin.importMusicItem(urlLike);
-            // 参考 MusicFree 实现，验证结果
-            if (result === null || result === undefined) {
-                return null;
-            }
-            if (typeof result !== 'object') {
-                console.error(`[JS_PLUGIN_RUNNER] Invalid import music item result from plugin ${pluginName}:`, typeof result);
-                throw new Error(`Plugin ${pluginName} returned invalid import music item result`);
-            }
-            return result;
-        } catch (error) {
-            console.error(`[JS_PLUGIN_RUNNER] importMusicItem error in plugin ${pluginName}:`, error.message);
-            throw new Error(`importMusicItem failed in plugin ${pluginName}: ${error.message}`);
-        }
-    }
-
-    async importMusicSheet(pluginName, urlLike) {
-        const plugin = this.plugins.get(pluginName);
-        if (!plugin) {
-            throw new Error(`Plugin ${pluginName} not found`);
-        }
-
-        // 检查插件是否有 importMusicSheet 方法 (按照官方文档标准)
-        if (!plugin.importMusicSheet || typeof plugin.importMusicSheet !== 'function') {
-            // 不输出调试信息以避免干扰通信
-            return null;
-        }
-
-        try {
-            const result = await plugin.importMusicSheet(urlLike);
-            // 参考 MusicFree 实现，验证结果
-            if (result === null || result === undefined) {
-                return null;
-            }
-            if (!Array.isArray(result)) {
-                console.error(`[JS_PLUGIN_RUNNER] Invalid import music sheet result from plugin ${pluginName}:`, typeof result);
-                throw new Error(`Plugin ${pluginName} returned invalid import music sheet result`);
-            }
-            return result;
-        } catch (error) {
-            console.error(`[JS_PLUGIN_RUNNER] importMusicSheet error in plugin ${pluginName}:`, error.message);
-            throw new Error(`importMusicSheet failed in plugin ${pluginName}: ${error.message}`);
-        }
-    }
-
-    async getTopLists(pluginName) {
-        const plugin = this.plugins.get(pluginName);
-        if (!plugin) {
-            throw new Error(`Plugin ${pluginName} not found`);
-        }
-
-        // 检查插件是否有 getTopLists 方法 (按照官方文档标准)
-        if (!plugin.getTopLists || typeof plugin.getTopLists !== 'function') {
-            // 不输出调试信息以避免干扰通信
-            return null;
-        }
-
-        try {
-            const result = await plugin.getTopLists();
-            // 参考 MusicFree 实现，验证结果
-            if (result === null || result === undefined) {
-                return null;
-            }
-            if (!Array.isArray(result)) {
-                console.error(`[JS_PLUGIN_RUNNER] Invalid top lists result from plugin ${pluginName}:`, typeof result);
-                throw new Error(`Plugin ${pluginName} returned invalid top lists result`);
-            }
-            return result;
-        } catch (error) {
-            console.error(`[JS_PLUGIN_RUNNER] getTopLists error in plugin ${pluginName}:`, error.message);
-            throw new Error(`getTopLists failed in plugin ${pluginName}: ${error.message}`);
-        }
-    }
-
-    async getTopListDetail(pluginName, topListItem, page = 1) {
+    /**
+     * 调用插件的可选方法，各方法共用同一套检查与结果校验流程
+     * @param {string} pluginName 插件名称
+     * @param {string} method 插件方法名（按照 MusicFree 官方文档标准）
+     * @param {Array} args 传给插件方法的参数
+     * @param {boolean} expectArray 结果是否应为数组，否则应为对象
+     */
+    async callPluginMethod(pluginName, method, args, expectArray = false) {
         const plugin = this.plugins.get(pluginName);
         if (!plugin) {
             throw new Error(`Plugin ${pluginName} not found`);
         }
 
-        // 检查插件是否有 getTopListDetail 方法 (按照官方文档标准)
-        if (!plugin.getTopListDetail || typeof plugin.getTopListDetail !== 'function') {
+        // 插件未实现该方法时返回 null - 参考 MusicFreeDesktop 实现
+        if (typeof plugin[method] !== 'function') {
             // 不输出调试信息以避免干扰通信
             return null;
         }
 
         try {
-            const result = await plugin.getTopListDetail(topListItem, page);
+            const result = await plugin[method](...args);
             // 参考 MusicFree 实现，验证结果
             if (result === null || result === undefined) {
                 return null;
             }
-            if (typeof result !== 'object') {
-                console.error(`[JS_PLUGIN_RUNNER] Invalid top list detail result from plugin ${pluginName}:`, typeof result);
-                throw new Error(`Plugin ${pluginName} returned invalid top list detail result`);
+            if (expectArray ? !Array.isArray(result) : typeof result !== 'object') {
+                console.error(`[JS_PLUGIN_RUNNER] Invalid ${method} result from plugin ${pluginName}:`, typeof result);
+                throw new Error(`Plugin ${pluginName} returned invalid ${method} result`);
             }
             return result;
         } catch (error) {
-            console.error(`[JS_PLUGIN_RUNNER] getTopListDetail error in plugin ${pluginName}:`, error.message);
-            throw new Error(`getTopListDetail failed in plugin ${pluginName}: ${error.message}`);
+            console.error(`[JS_PLUGIN_RUNNER] ${method} error in plugin ${pluginName}:`, error.message);
+            throw new Error(`${method} failed in plugin ${pluginName}: ${error.message}`);
         }
     }
 
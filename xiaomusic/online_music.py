@@ -15,6 +15,7 @@ import aiohttp
 from xiaomusic.const import (
     PLAY_TYPE_ALL,
 )
+from xiaomusic.utils.network_utils import get_shared_session
 
 
 def _build_keyword(song_name, artist):
@@ -50,6 +51,14 @@ class OnlineMusicService:
     负责处理在线音乐搜索、插件调用和播放链接获取。
     """
 
+    __slots__ = (
+        "log",
+        "js_plugin_manager",
+        "xiaomusic",
+        "_search_sem",
+        "_search_sem_limit",
+    )
+
     def __init__(self, log, js_plugin_manager, xiaomusic_instance=None):
         """初始化在线音乐服务
 
@@ -60,6 +69,9 @@ class OnlineMusicService:
         self.log = log
         self.js_plugin_manager = js_plugin_manager
         self.xiaomusic = xiaomusic_instance
+        # 插件并发搜索限流，上限来自插件配置，配置变化时重建
+        self._search_sem = None
+        self._search_sem_limit = 0
 
     async def get_music_list_online(
         self, plugin="all", keyword="", page=1, limit=20, **kwargs
@@ -279,11 +291,12 @@ class OnlineMusicService:
             else:
                 # 获取歌曲列表
                 result = await self.get_music_list_online(keyword=name, limit=10)
-                self.log.info(f"在线搜索歌手的歌曲列表: {result}")
+                # 完整结果只在 DEBUG 日志中输出，%s 占位符延迟格式化
+                self.log.debug("在线搜索歌手的歌曲列表: %s", result)
 
                 if result.get("success") and result.get("total") > 0:
                     # 打印输出 result.data
-                    self.log.info(f"歌曲列表: {result.get('data')}")
+                    self.log.debug("歌曲列表: %s", result.get("data"))
                     list_name = "_online_" + result.get("artist")
                     # 调用公共函数,处理歌曲信息 -> 添加歌单 -> 播放歌单
                     return await self.push_music_list_play(
@@ -464,7 +477,7 @@ class OnlineMusicService:
 
             if result.get("success") and result.get("total") > 0:
                 # 打印输出 result.data
-                self.log.info(f"在线搜索的歌曲列表: {result.get('data')}")
+                self.log.debug("在线搜索的歌曲列表: %s", result.get("data"))
                 # 根据搜素关键字，智能搜索出最符合的一条music_item
                 top_one_list = await self._search_top_one(
                     result.get("data"), search_key, name
@@ -538,7 +551,8 @@ class OnlineMusicService:
 
     def _get_plugin_proxy_url(self, origin_data):
         """获取插件源代理URL"""
-        origin_data = json.dumps(origin_data)
+        # 紧凑的 UTF-8 JSON：中文不转义为 \uXXXX，去掉多余空格，代理 URL 更短
+        origin_data = json.dumps(origin_data, ensure_ascii=False, separators=(",", ":"))
         datab64 = base64.b64encode(origin_data.encode("utf-8")).decode("utf-8")
         plugin_source_url = f"{self.xiaomusic.hostname}:{self.xiaomusic.public_port}/api/proxy/plugin-url?data={datab64}"
         self.log.info(f"plugin_source_url : {plugin_source_url}")
@@ -559,6 +573,8 @@ class OnlineMusicService:
         enabled_plugins = self.js_plugin_manager.get_enabled_plugins()
         if not enabled_plugins:
             return {"success": False, "error": "没有可用的接口和插件，请先进行配置！"}
+        # 开放接口由 _execute_concurrent_searches 单独搜索，不参与插件并发搜索
+        enabled_plugins = [name for name in enabled_plugins if name != "OpenAPI"]
 
         results = []
         sources = {}
@@ -567,18 +583,21 @@ class OnlineMusicService:
         plugin_count = len(enabled_plugins)
         item_limit = max(1, limit // plugin_count) if plugin_count > 0 else limit
 
-        # 并行搜索所有插件
-        search_tasks = [
-            self._search_plugin_task(plugin_name, keyword, page, item_limit)
-            for plugin_name in enabled_plugins
-        ]
+        # 并行搜索所有插件，同时进行的搜索数量受信号量限制
+        search_sem = self._get_search_semaphore()
 
-        plugin_results = await asyncio.gather(*search_tasks, return_exceptions=True)
+        async def _guarded(plugin_name):
+            async with search_sem:
+                return await self._search_plugin_task(
+                    plugin_name, keyword, page, item_limit
+                )
 
-        # 处理搜索结果
-        for i, result in enumerate(plugin_results):
-            plugin_name = list(enabled_plugins)[i]
+        search_tasks = [_guarded(plugin_name) for plugin_name in enabled_plugins]
 
+        plugin_results = await asyncio.gather(*search_tasks, return_exceptions=True)
+
+        # 处理搜索结果，结果顺序与插件列表一一对应
+        for plugin_name, result in zip(enabled_plugins, plugin_results, strict=True):
             # 检查是否为异常对象
             if isinstance(result, Exception):
                 self.log.error(f"插件 {plugin_name} 搜索失败: {result}")
@@ -623,6 +642,14 @@ class OnlineMusicService:
             "limit": limit,
         }
 
+    def _get_search_semaphore(self) -> asyncio.Semaphore:
+        """获取插件搜索信号量，上限取自插件配置 search_concurrency"""
+        limit = self.js_plugin_manager.get_search_concurrency()
+        if self._search_sem is None or limit != self._search_sem_limit:
+            self._search_sem = asyncio.Semaphore(limit)
+            self._search_sem_limit = limit
+        return self._search_sem
+
     async def _search_specific_plugin(self, plugin, keyword, artist, page, limit):
         """搜索指定插件
 
@@ -637,7 +664,7 @@ class OnlineMusicService:
             dict: 搜索结果
         """
         try:
-            results = self.js_plugin_manager.search(plugin, keyword, page, limit)
+            results = await self._search_plugin_task(plugin, keyword, page, limit)
 
             # 额外检查 resources 字段
             data_list = results.get("data", [])
@@ -659,12 +686,14 @@ class OnlineMusicService:
             return {"success": False, "error": str(e)}
 
     async def _search_plugin_task(self, plugin_name, keyword, page, limit):
-        """单个插件搜索任务"""
-        try:
-            return self.js_plugin_manager.search(plugin_name, keyword, page, limit)
-        except Exception as e:
-            # 直接抛出异常，让 asyncio.gather 处理
-            raise e
+        """单个插件搜索任务，指定插件搜索与全部插件搜索共用
+
+        插件调用是同步阻塞的（等待 Node.js 进程响应），放到线程中执行，避免阻塞事件循环。
+        异常直接抛出，由调用方（asyncio.gather 或 _search_specific_plugin）处理。
+        """
+        return await asyncio.to_thread(
+            self.js_plugin_manager.search, plugin_name, keyword, page, limit
+        )
 
     # 调用MusicFree插件获取真实播放url
     async def get_media_source_url(self, music_item, quality: str = "standard"):
@@ -836,9 +865,12 @@ class OnlineMusicService:
             return {"success": False, "error": f"Plugin {plugin_name} not enabled"}
 
         try:
-            # 调用插件方法，传递额外参数
-            result = getattr(self.js_plugin_manager, method_name)(
-                plugin_name, music_item, **kwargs
+            # 调用插件方法，传递额外参数（同步阻塞调用，放到线程中执行）
+            result = await asyncio.to_thread(
+                getattr(self.js_plugin_manager, method_name),
+                plugin_name,
+                music_item,
+                **kwargs,
             )
             if (
                 not result
@@ -920,20 +952,18 @@ class OnlineMusicService:
             if not _is_safe_hostname(parsed_url):
                 return url  # 返回原始URL
 
-            # 创建aiohttp客户端会话
-            async with aiohttp.ClientSession() as session:
-                # 发送HEAD请求跟随重定向
-                async with session.head(
-                    url,
-                    allow_redirects=True,
-                    timeout=aiohttp.ClientTimeout(total=timeout),
-                ) as response:
-                    # 获取最终重定向后的URL
-                    final_url = str(response.url)
-                    # 如果需要转换m4s格式
-                    if convert_m4s and final_url.lower().endswith(".m4s"):
-                        final_url = final_url[:-4] + ".mp3"
-                    return final_url
+            # 使用共享的aiohttp会话发送HEAD请求跟随重定向
+            async with get_shared_session().head(
+                url,
+                allow_redirects=True,
+                timeout=aiohttp.ClientTimeout(total=timeout),
+            ) as response:
+                # 获取最终重定向后的URL
+                final_url = str(response.url)
+                # 如果需要转换m4s格式
+                if convert_m4s and final_url.lower().endswith(".m4s"):
+                    final_url = final_url[:-4] + ".mp3"
+                return final_url
         except Exception:
             return url  # 返回原始URL
 
@@ -36,10 +36,12 @@ from xiaomusic.utils.music_utils import (
 from xiaomusic.utils.network_utils import (
     MusicUrlCache,
     check_bili_fav_list,
+    close_shared_session,
     download_one_music,
     download_playlist,
     downloadfile,
     fetch_json_get,
+    get_shared_session,
     text_to_mp3,
 )
 from xiaomusic.utils.system_utils import (
@@ -109,6 +111,8 @@ __all__ = [
     "download_playlist",
     "downloadfile",
     "fetch_json_get",
+    "get_shared_session",
+    "close_shared_session",
     "text_to_mp3",
     # system_utils
     "deepcopy_data_no_sensitive_info",
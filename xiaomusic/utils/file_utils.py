@@ -177,13 +177,13 @@ def chmodfile(file_path: str) -> None:
 
 def chmoddir(dir_path: str) -> None:
     """修改目录下所有文件的权限为 775"""
-    # 获取指定目录下的所有文件和子目录
-    for item in os.listdir(dir_path):
-        item_path = os.path.join(dir_path, item)
-        # 确保是文件，且不是目录
-        if os.path.isfile(item_path):
-            try:
-                os.chmod(item_path, 0o775)
-                log.info(f"Changed permissions of file: {item_path}")
-            except Exception as e:
-                log.info(f"chmoddir failed: {e}")
+    # 获取指定目录下的所有文件和子目录（scandir 自带文件类型，无需逐个 stat）
+    with os.scandir(dir_path) as entries:
+        for entry in entries:
+            # 确保是文件，且不是目录
+            if entry.is_file():
+                try:
+                    os.chmod(entry.path, 0o775)
+                    log.info(f"Changed permissions of file: {entry.path}")
+                except Exception as e:
+                    log.info(f"chmoddir failed: {e}")
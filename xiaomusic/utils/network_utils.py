@@ -19,6 +19,38 @@ import edge_tts
 
 log = logging.getLogger(__package__)
 
+# 进程内共享的 HTTP 会话，复用连接池和 DNS 缓存，首次使用时创建
+_shared_session: aiohttp.ClientSession | None = None
+
+
+def get_shared_session() -> aiohttp.ClientSession:
+    """
+    获取共享的 aiohttp 会话
+
+    在线搜索、播放链接解析等频繁的短请求复用同一个连接池，
+    省去每次请求重新建立 TCP/TLS 连接和解析 DNS 的开销。
+    需要在事件循环中调用，会话关闭后再次调用会重新创建。
+
+    Returns:
+        共享的 aiohttp.ClientSession
+    """
+    global _shared_session
+    if _shared_session is None or _shared_session.closed:
+        _shared_session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=64, limit_per_host=8, ttl_dns_cache=300
+            )
+        )
+    return _shared_session
+
+
+async def close_shared_session() -> None:
+    """关闭共享的 aiohttp 会话"""
+    global _shared_session
+    if _shared_session is not None and not _shared_session.closed:
+        await _shared_session.close()
+    _shared_session = None
+
 
 async def downloadfile(url: str) -> str:
     """
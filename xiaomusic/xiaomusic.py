@@ -97,6 +97,13 @@ class XiaoMusic:
             self.log.error(f"Failed to initialize JS Plugin Manager: {e}")
             self.js_plugin_manager = None
 
+        # 监控插件目录及配置文件，失败时插件管理器照常可用
+        if self.js_plugin_manager:
+            try:
+                self.js_plugin_manager.start_watch()
+            except Exception as e:
+                self.log.warning(f"Failed to watch JS plugins: {e}")
+
         # 初始化 JS 插件适配器
         try:
             from xiaomusic.js_adapter import JSAdapter